@@ -17,24 +17,180 @@ New Capabilities (Token Optimization):
 """
 
 import os
+import asyncio
 import json
+import hashlib
+import gzip
+import zlib
 import subprocess
 import plistlib
+import xml.etree.ElementTree as ElementTree
 import re
+import shutil
+import signal
+import functools
+import heapq
+import bisect
+import fnmatch
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, NamedTuple, Optional, Union
 from datetime import datetime
 from mcp.server.fastmcp import FastMCP
 
+try:
+    # Optional: orjson parses large JSON payloads several times faster
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads  # also accepts bytes
+
+try:
+    # Optional: pathspec gives full .gitignore semantics to directory walks
+    import pathspec
+except ImportError:
+    pathspec = None
+
 mcp = FastMCP("OkangaMCP")
 
 # ============================================================================
 # TOKEN OPTIMIZATION & SOURCE MANAGEMENT (NEW)
 # ============================================================================
 
-def _estimate_tokens(text: str) -> int:
-    """Rough estimation of tokens (1 token ~= 4 chars)."""
-    return len(text) // 4
+@functools.lru_cache(maxsize=256)
+def _resolve(path: str) -> Path:
+    """Expand and resolve a user-supplied path, memoized (resolve() walks every component)."""
+    return Path(path).expanduser().resolve(strict=False)
+
+# Memoization for expensive tool results: entries are (stamp, value) where
+# the stamp is a tuple of mtimes, so any change to the inputs invalidates
+# the entry. Caches are bounded; the oldest entry is evicted first.
+_MEMO_MAXSIZE = 32
+
+def _mtime_stamp(*paths: Path) -> tuple:
+    """mtimes (ns) of the given paths, 0 for missing ones: a cheap change detector."""
+    stamp = []
+    for f in paths:
+        try:
+            stamp.append(f.stat().st_mtime_ns)
+        except OSError:
+            stamp.append(0)
+    return tuple(stamp)
+
+def _memo_get(cache: Dict, key: Any, stamp: tuple) -> Any:
+    """Cached value for key if it was stored with the same stamp, else None."""
+    cached = cache.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    return None
+
+def _memo_put(cache: Dict, key: Any, stamp: tuple, value: Any) -> None:
+    cache.pop(key, None)
+    if len(cache) >= _MEMO_MAXSIZE:
+        cache.pop(next(iter(cache)))
+    cache[key] = (stamp, value)
+
+# Rough heuristic shared by every estimate: 1 token ~= 4 bytes of text
+_BYTES_PER_TOKEN = 4
+
+def _estimate_tokens(text: Union[str, bytes]) -> int:
+    """Rough estimation of tokens (1 token ~= 4 chars). Pass bytes to skip decoding."""
+    return len(text) // _BYTES_PER_TOKEN
+
+# How much of a file tools embed in their response:
+#   meta    - size and mtime only
+#   digest  - meta + SHA-1 (enough to tell whether two files match)
+#   content - meta + the decoded text
+FileDetail = Literal["meta", "digest", "content"]
+
+def _file_info(path: Path, detail: FileDetail = "meta") -> Dict[str, Any]:
+    """Describe a file at the requested detail level instead of always inlining it."""
+    st = path.stat()
+    info = {
+        "size_bytes": st.st_size,
+        "mtime": datetime.fromtimestamp(st.st_mtime).isoformat()
+    }
+    if detail != "meta":
+        with open(path, 'rb') as f:
+            data = f.read()
+        if detail == "digest":
+            info["sha1"] = hashlib.sha1(data).hexdigest()
+        else:
+            info["content"] = data.decode('utf-8', errors='replace')
+    return info
+
+# Directories pruned from project-wide searches (build artifacts, vendored deps)
+_SEARCH_EXCLUDE_DIRS = (".git", "Pods", "DerivedData", ".build", ".swiftpm", "fastlane")
+_SEARCH_MAX_RESULTS = 50
+# Characters that are literal in grep basic regex but operators in rg's dialect
+_BRE_LITERALS = frozenset("(){}|+?")
+# Swift structure parser: braces drive depth, imports are always kept
+_SWIFT_STRUCT_RE = re.compile(rb"([{}])|^[ \t]*import", re.MULTILINE)
+_HIDDEN_MARKER = b"// ... implementation hidden ..."
+# Lines of build output retained to produce the "last 2000 chars" excerpt
+_BUILD_TAIL_LINES = 500
+_BUILD_TIMEOUT = 300  # seconds
+# Case-insensitive diagnostic markers, matched against raw stderr bytes
+_BUILD_DIAG_RE = re.compile(rb"(error|warning):", re.IGNORECASE)
+_BUILD_ERROR_RE = re.compile(rb"error:", re.IGNORECASE)
+
+def _terminate(proc: subprocess.Popen, grace: float = 5.0, group: bool = False) -> None:
+    """
+    Stop a child process: SIGTERM first, escalating to SIGKILL if it ignores us.
+    With group=True (proc started with start_new_session=True) the whole
+    process group is signalled, so grandchildren that inherited the pipes
+    (compiler and build-service processes) die with it.
+    """
+    if not group:
+        if proc.poll() is not None:
+            return
+        proc.terminate()
+        try:
+            proc.wait(timeout=grace)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        return
+    
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        proc.wait()  # group already gone; just reap
+        return
+    try:
+        proc.wait(timeout=grace)
+    except subprocess.TimeoutExpired:
+        pass
+    # Members that outlived the leader, or ignored SIGTERM
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    proc.wait()
+
+class _Watchdog(threading.Timer):
+    """Timer that terminates a still-running proc; `fired` tells whether it had to."""
+    
+    def __init__(self, proc: subprocess.Popen, timeout: float, group: bool = False):
+        super().__init__(timeout, self._expire, (proc,))
+        self.daemon = True
+        self.fired = False
+        self.group = group
+    
+    def _expire(self, proc: subprocess.Popen) -> None:
+        # A group is only done when its output readers are, which the caller
+        # signals by cancelling; the leader exiting is not enough
+        if self.group or proc.poll() is None:
+            self.fired = True
+            _terminate(proc, group=self.group)
+
+def _watchdog(proc: subprocess.Popen, timeout: float, group: bool = False) -> _Watchdog:
+    """Terminate proc (or its process group) after `timeout` seconds unless the returned timer is cancelled."""
+    timer = _Watchdog(proc, timeout, group)
+    timer.start()
+    return timer
 
 @mcp.tool()
 def read_swift_structure(file_path: str) -> Dict[str, Any]:
@@ -48,7 +204,7 @@ def read_swift_structure(file_path: str) -> Dict[str, Any]:
     Returns:
         The file content with function bodies replaced by '// ... implementation ...'
     """
-    p = Path(file_path).expanduser().resolve()
+    p = _resolve(file_path)
     
     if not p.exists():
         return {"error": f"File not found: {file_path}"}
@@ -57,56 +213,134 @@ def read_swift_structure(file_path: str) -> Dict[str, Any]:
         return {"error": "This tool is optimized for .swift files only"}
 
     try:
-        with open(p, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        # Work on raw bytes; decode once at the end
+        with open(p, 'rb') as f:
+            data = f.read()
 
+        # One C-level regex scan finds every line where something happens
+        # (a brace or an import) and records its byte bounds; depth is
+        # constant between those lines, so nothing else needs visiting
+        brace_deltas = {}
+        import_lines = set()
+        event_bounds = {}  # line number -> (start, end) byte offsets
+        line_no = 0
+        last_pos = 0
+        for m in _SWIFT_STRUCT_RE.finditer(data):
+            pos = m.start()
+            line_no += data.count(b"\n", last_pos, pos)
+            last_pos = pos
+            if line_no not in event_bounds:
+                end = data.find(b"\n", pos)
+                event_bounds[line_no] = (data.rfind(b"\n", 0, pos) + 1, len(data) if end < 0 else end)
+            brace = m.group(1)
+            if brace is None:
+                import_lines.add(line_no)
+            else:
+                brace_deltas[line_no] = brace_deltas.get(line_no, 0) + (1 if brace == b"{" else -1)
+
+        total_lines = data.count(b"\n")
+        if data and not data.endswith(b"\n"):
+            total_lines += 1
+
+        # We keep level 0 (top level) and level 1 (inside class/struct)
+        # We hide level 2+ (inside functions/computed props), emitting one
+        # marker per hidden run. Depth changes apply AFTER a line, so we see
+        # 'func myFunc() {' but not the next line.
         structured_lines = []
         brace_depth = 0
-        in_multiline_comment = False
         skipped_block = False
+        line = 0        # first line not yet emitted or skipped
+        line_start = 0  # its byte offset
 
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            
-            # Simple comment handling
-            if "/*" in stripped: in_multiline_comment = True
-            if "*/" in stripped: in_multiline_comment = False
-            
-            # Count braces (very basic heuristic)
-            open_braces = line.count("{")
-            close_braces = line.count("}")
-            
-            # Determine if we keep this line
-            # We keep level 0 (top level) and level 1 (inside class/struct)
-            # We hide level 2+ (inside functions/computed props)
-            should_keep = brace_depth < 2 or stripped.startswith("import")
-            
-            # Update depth for next line
-            # Note: We update depth AFTER checking if we keep the start of the block
-            # This ensures we see 'func myFunc() {' but not the next line.
-            
-            if should_keep:
-                structured_lines.append(f"{i+1}: {line.rstrip()}")
+        def keep_run(first, chunk):
+            for n, text in enumerate(chunk.split(b"\n"), first + 1):
+                structured_lines.append(b"%d: %s" % (n, text.rstrip()))
+
+        for event in sorted(event_bounds):
+            start, end = event_bounds[event]
+            if brace_depth < 2:
+                # The run up to and including the event line is visible
+                keep_run(line, data[line_start:end])
                 skipped_block = False
             else:
-                if not skipped_block:
-                    structured_lines.append(f"{i+1}: {' ' * (brace_depth * 2)}// ... implementation hidden ...")
+                # Fast-forward over the hidden run; imports stay visible
+                is_import = event in import_lines
+                if not skipped_block and (line < event or not is_import):
+                    structured_lines.append(b"%d: %s%s" % (line + 1, b" " * (brace_depth * 2), _HIDDEN_MARKER))
                     skipped_block = True
-            
-            brace_depth += (open_braces - close_braces)
+                if is_import:
+                    structured_lines.append(b"%d: %s" % (event + 1, data[start:end].rstrip()))
+                    skipped_block = False
+            brace_depth += brace_deltas.get(event, 0)
+            line = event + 1
+            line_start = end + 1
+
+        # Lines after the last event share the final depth
+        if line < total_lines:
+            if brace_depth < 2:
+                tail = data[line_start:]
+                keep_run(line, tail[:-1] if tail.endswith(b"\n") else tail)
+            elif not skipped_block:
+                structured_lines.append(b"%d: %s%s" % (line + 1, b" " * (brace_depth * 2), _HIDDEN_MARKER))
 
-        content = "\n".join(structured_lines)
+        structure = b"\n".join(structured_lines)
         return {
             "path": str(p),
-            "structure_content": content,
-            "original_size": len(lines),
-            "token_estimate": _estimate_tokens(content),
-            "savings": f"{100 - (len(structured_lines)/len(lines)*100):.1f}% reduction"
+            "structure_content": structure.decode('utf-8'),
+            "original_size": total_lines,
+            "token_estimate": _estimate_tokens(structure),
+            "savings": f"{100 - (len(structured_lines)/total_lines*100):.1f}% reduction"
         }
 
     except Exception as e:
         return {"error": str(e)}
 
+# Sparse line index for read_file_snippet: newline counts at 1MB chunk
+# boundaries, cached per file and invalidated by (mtime, size).
+_LINE_INDEX_CHUNK = 1 << 20
+_LINE_INDEX_CACHE_MAX = 64
+_LINE_INDEX_CACHE: Dict[str, tuple] = {}
+
+def _line_index(p: Path, st: os.stat_result) -> tuple:
+    """Return (newline counts before each chunk, total line count) for a file."""
+    key = str(p)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _LINE_INDEX_CACHE.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    
+    counts = [0]
+    last = b"\n"
+    with open(p, 'rb') as f:
+        while True:
+            chunk = f.read(_LINE_INDEX_CHUNK)
+            if not chunk:
+                break
+            counts.append(counts[-1] + chunk.count(b"\n"))
+            last = chunk[-1:]
+    # A final line without a trailing newline still counts
+    total_lines = counts[-1] + (last != b"\n")
+    
+    if len(_LINE_INDEX_CACHE) >= _LINE_INDEX_CACHE_MAX:
+        _LINE_INDEX_CACHE.pop(next(iter(_LINE_INDEX_CACHE)))
+    _LINE_INDEX_CACHE[key] = (stamp, (counts, total_lines))
+    return counts, total_lines
+
+def _line_offset(f, counts: List[int], line_idx: int, size: int) -> int:
+    """Byte offset where 0-based line `line_idx` starts (EOF if past the last newline)."""
+    if line_idx == 0:
+        return 0
+    if line_idx > counts[-1]:
+        return size
+    # Chunk containing the line_idx-th newline, then scan only that chunk
+    chunk_no = bisect.bisect_left(counts, line_idx) - 1
+    f.seek(chunk_no * _LINE_INDEX_CHUNK)
+    chunk = f.read(_LINE_INDEX_CHUNK)
+    pos = -1
+    for _ in range(line_idx - counts[chunk_no]):
+        pos = chunk.find(b"\n", pos + 1)
+    return chunk_no * _LINE_INDEX_CHUNK + pos + 1
+
 @mcp.tool()
 def read_file_snippet(file_path: str, start_line: int, end_line: int) -> Dict[str, Any]:
     """
@@ -117,89 +351,227 @@ def read_file_snippet(file_path: str, start_line: int, end_line: int) -> Dict[st
         start_line: First line to read (1-based index)
         end_line: Last line to read (inclusive)
     """
-    p = Path(file_path).expanduser().resolve()
+    p = _resolve(file_path)
     
-    if not p.exists():
+    try:
+        st = p.stat()
+    except FileNotFoundError:
         return {"error": f"File not found: {file_path}"}
         
     try:
-        with open(p, 'r', encoding='utf-8') as f:
-            all_lines = f.readlines()
-            
+        newline_counts, total_lines = _line_index(p, st)
+        
         # Adjust for 0-based indexing
         start_idx = max(0, start_line - 1)
-        end_idx = min(len(all_lines), end_line)
+        end_idx = min(total_lines, end_line)
+        if end_idx < 0:
+            # Negative end counts back from EOF, as list slicing did
+            end_idx = max(0, total_lines + end_idx)
         
-        selected_lines = all_lines[start_idx:end_idx]
-        content = "".join(selected_lines)
+        # Seek straight to the requested lines instead of reading the whole file
+        content = ""
+        if end_idx > start_idx:
+            with open(p, 'rb') as f:
+                begin = _line_offset(f, newline_counts, start_idx, st.st_size)
+                end = _line_offset(f, newline_counts, end_idx, st.st_size)
+                f.seek(begin)
+                content = f.read(end - begin).decode('utf-8').replace('\r\n', '\n')
         
         return {
             "path": str(p),
             "range": f"Lines {start_line}-{end_line}",
             "content": content,
-            "total_file_lines": len(all_lines)
+            "total_file_lines": total_lines
         }
     except Exception as e:
         return {"error": str(e)}
 
+def _bre_to_rust_regex(pattern: str) -> str:
+    """
+    Translate a grep basic regex (the dialect search_project has always
+    accepted) into rg's Rust regex syntax: bare ( ) { } | + ? become
+    literals, their backslashed GNU forms become operators, \\< and \\>
+    become word boundaries and bracket expressions keep literal backslashes.
+    ^ and $ anchor only at the ends of the pattern or of a group/alternative
+    and are literal elsewhere ($0, $viewModel).
+    """
+    out = []
+    i, n = 0, len(pattern)
+    # A '*' with nothing to repeat (pattern start, after ^ or a group/alternation) is literal
+    repeatable = False
+    # At the start of the pattern or right after \( or \|, where ^ anchors
+    at_start = True
+    while i < n:
+        c = pattern[i]
+        opens = False
+        if c == "\\" and i + 1 < n:
+            nxt = pattern[i + 1]
+            if nxt in _BRE_LITERALS:
+                out.append(nxt)
+                repeatable = nxt not in "(|"
+                opens = nxt in "(|"
+            elif nxt in "<>":
+                out.append(r"\b")
+                repeatable = False
+            else:
+                out.append(c + nxt)
+                repeatable = True
+            i += 2
+        elif c == "[":
+            # Bracket expression: a leading ']' is a member, backslash is literal
+            j = i + 1
+            if j < n and pattern[j] == "^":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                if pattern.startswith("[:", j) and ":]" in pattern[j + 2:]:
+                    j = pattern.index(":]", j + 2) + 2
+                else:
+                    j += 1
+            if j >= n:
+                # Unterminated: match the '[' literally
+                out.append("\\[")
+                i += 1
+            else:
+                body = pattern[i + 1:j].replace("\\", "\\\\").replace("[", "\\[").replace("\\[:", "[:")
+                out.append("[" + body + "]")
+                i = j + 1
+            repeatable = True
+        elif c == "^" and at_start:
+            out.append(c)
+            repeatable = False
+            i += 1
+        elif c == "$" and (i == n - 1 or pattern.startswith(("\\)", "\\|"), i + 1)):
+            out.append(c)
+            repeatable = False
+            i += 1
+        else:
+            if c in _BRE_LITERALS or c in "^$" or (c == "*" and not repeatable):
+                out.append("\\" + c)
+                repeatable = True
+            else:
+                out.append(c)
+                repeatable = True
+            i += 1
+        at_start = opens
+    return "".join(out)
+
 @mcp.tool()
 def search_project(query: str, project_path: str, case_sensitive: bool = False) -> Dict[str, Any]:
     """
-    Fast text search (grep) across the project. Use this to find where variables/functions are defined.
-    Automatically excludes .git, Pods, DerivedData, and .build folders.
+    Fast text search (ripgrep, falling back to grep) across the project. Use this to find where variables/functions are defined.
+    Automatically excludes .git, Pods, DerivedData, .build, .swiftpm and fastlane folders.
     
     Args:
-        query: Regex or string pattern to search for
+        query: Pattern in grep basic regex syntax: . * ^ $ [...] are operators,
+            while ( ) { } | + ? match literally (use \\( \\| \\+ etc. for groups,
+            alternation and repetition)
         project_path: Root directory to search
         case_sensitive: Whether to respect case (default False)
     """
-    p = Path(project_path).expanduser().resolve()
-    
-    # Exclusions
-    exclude_dirs = "{.git,Pods,DerivedData,.build,.swiftpm,fastlane}"
-    
-    cmd = ["grep", "-rn"] # Recursive, Line number
-    
-    if not case_sensitive:
-        cmd.append("-i")
-        
-    cmd.extend(["--exclude-dir=" + exclude_dirs, query, str(p)])
+    p = _resolve(project_path)
+    
+    # Prefer ripgrep (parallel walker, faster matcher); fall back to grep
+    if shutil.which("rg"):
+        cmd = ["rg", "--line-number", "--no-heading", "--with-filename"]
+        cmd.append("-s" if case_sensitive else "-i")
+        for name in _SEARCH_EXCLUDE_DIRS:
+            cmd.extend(["-g", "!" + name])
+        # rg honors .gitignore itself; add the tool-specific ignore file.
+        # Its patterns are matched relative to rg's working directory, so rg
+        # runs from the project root (see cwd below) for anchored ones to apply
+        okangaignore = p / ".okangaignore"
+        if okangaignore.is_file():
+            cmd.extend(["--ignore-file", str(okangaignore)])
+        # Cap output so we don't buffer megabytes for a 50-line truncation
+        cmd.extend(["--max-count", str(_SEARCH_MAX_RESULTS), "--max-columns", "500"])
+        pattern = _bre_to_rust_regex(query)
+    else:
+        cmd = ["grep", "-rn"] # Recursive, Line number
+        if not case_sensitive:
+            cmd.append("-i")
+        # --exclude-dir takes one glob per flag; brace lists are not expanded
+        cmd.extend("--exclude-dir=" + name for name in _SEARCH_EXCLUDE_DIRS)
+        # grep has no ignore-file support: apply the plain name patterns of
+        # .okangaignore to both files and directories
+        try:
+            lines = (p / ".okangaignore").read_text(errors="replace").splitlines()
+        except OSError:
+            lines = []
+        for glob in _plain_name_globs(lines):
+            cmd.extend(["--exclude=" + glob, "--exclude-dir=" + glob])
+        pattern = query
+    
+    # rg searches '.' from the project root (its ignore-file patterns are
+    # cwd-relative); its paths are made absolute again below
+    use_rg = cmd[0] == "rg"
+    cmd.extend([pattern, "." if use_rg else str(p)])
     
     try:
-        # Run grep
-        result = subprocess.run(
+        # Stream results and stop reading once we have enough matches,
+        # rather than buffering the whole search output in memory
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
+            cwd=str(p) if use_rg else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=10
+            errors="replace",
+            bufsize=-1
         )
+        # Drained on a thread so a flood of unreadable-file messages cannot
+        # block the child while stdout is being read; only the tail is kept
+        stderr_tail = deque(maxlen=20)
+        stderr_reader = threading.Thread(target=stderr_tail.extend, args=(proc.stderr,), daemon=True)
+        stderr_reader.start()
+        timer = _watchdog(proc, 10)
         
+        root = str(p)
         matches = []
-        lines = result.stdout.strip().split('\n')
         
         # Limit results to prevent context flooding
         truncated = False
-        if len(lines) > 50:
-            lines = lines[:50]
-            truncated = True
-            
-        for line in lines:
-            if not line: continue
-            parts = line.split(':', 2) # path:line:content
-            if len(parts) >= 3:
-                matches.append({
-                    "file": parts[0],
-                    "line": parts[1],
-                    "match": parts[2].strip()
-                })
+        try:
+            for line in proc.stdout:
+                if len(matches) >= _SEARCH_MAX_RESULTS:
+                    truncated = True
+                    break
+                parts = line.rstrip('\n').split(':', 2) # path:line:content
+                if len(parts) >= 3:
+                    if use_rg:
+                        parts[0] = os.path.join(root, parts[0][2:] if parts[0].startswith("./") else parts[0])
+                    matches.append({
+                        "file": parts[0],
+                        "line": parts[1],
+                        "match": parts[2].strip()
+                    })
+            returncode = None if truncated else proc.wait()
+        finally:
+            timer.cancel()
+            _terminate(proc)
+            proc.stdout.close()
+            stderr_reader.join()
+            proc.stderr.close()
+        
+        if timer.fired:
+            return {"error": "Search timed out after 10 seconds", "query": query}
+        
+        # grep and rg both exit 2 on errors (bad pattern, unreadable files)
+        search_errors = "".join(stderr_tail).strip()
+        if returncode == 2 and not matches:
+            return {"error": search_errors or f"{cmd[0]} failed", "query": query}
                 
-        return {
+        result = {
             "query": query,
             "match_count": len(matches),
             "matches": matches,
             "truncated_results": truncated,
             "note": "Showing top 50 matches. Refine query if needed."
         }
+        if returncode == 2:
+            result["search_errors"] = search_errors
+        return result
         
     except Exception as e:
         return {"error": str(e)}
@@ -210,16 +582,17 @@ def check_file_size(file_path: str) -> Dict[str, Any]:
     Check the size and estimated token count of a file.
     Use this before reading large files to see if you should use 'read_swift_structure' instead.
     """
-    p = Path(file_path).expanduser().resolve()
+    p = _resolve(file_path)
     
-    if not p.exists():
+    try:
+        # One stat answers both "does it exist" and "how big is it"
+        stats = p.stat()
+    except FileNotFoundError:
         return {"error": "File not found"}
         
     try:
-        stats = p.stat()
         size_bytes = stats.st_size
-        # Rough heuristic: 1 token ~= 4 bytes of text
-        est_tokens = size_bytes // 4
+        est_tokens = size_bytes // _BYTES_PER_TOKEN
         
         status = "safe"
         if est_tokens > 10000: status = "very_large"
@@ -240,19 +613,23 @@ def check_file_size(file_path: str) -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
-def analyze_xcode_project(project_path: str) -> Dict[str, Any]:
+def analyze_xcode_project(project_path: str, detail: FileDetail = "meta") -> Dict[str, Any]:
     """
     Comprehensive analysis of Xcode project structure.
     
     Args:
         project_path: Path to .xcodeproj or .xcworkspace file
+        detail: How much of the Podfile to return: "meta" (size + mtime, default),
+            "digest" (adds SHA-1) or "content" (adds text)
     
     Returns:
         Project structure, targets, schemes, and configuration overview
     """
-    p = Path(project_path).expanduser().resolve()
+    p = _resolve(project_path)
     
-    if not p.exists():
+    try:
+        p.stat()
+    except OSError:
         return {"error": f"Project not found: {project_path}"}
     
     result = {
@@ -278,35 +655,292 @@ def analyze_xcode_project(project_path: str) -> Dict[str, Any]:
     if p.suffix == ".xcodeproj":
         result["is_project"] = True
         pbxproj = p / "project.pbxproj"
-        if pbxproj.exists():
-            try:
-                # Just get size for now - full parsing is complex
-                result["project_file_size"] = pbxproj.stat().st_size
-                result["project_file_exists"] = True
-            except Exception as e:
-                result["project_error"] = str(e)
+        try:
+            # Just get size for now - full parsing is complex
+            result["project_file_size"] = pbxproj.stat().st_size
+            result["project_file_exists"] = True
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            result["project_error"] = str(e)
+    
+    # One listing of the parent answers the Podfile/Package.swift/Cartfile checks
+    try:
+        with os.scandir(p.parent) as it:
+            siblings = {e.name for e in it}
+    except OSError:
+        siblings = set()
     
     # Check for Podfile
     podfile = p.parent / "Podfile"
-    result["has_cocoapods"] = podfile.exists()
+    result["has_cocoapods"] = "Podfile" in siblings
     if result["has_cocoapods"]:
         try:
-            with open(podfile, 'r') as f:
-                result["podfile_content"] = f.read()
+            result["podfile"] = _file_info(podfile, detail)
         except Exception as e:
             result["podfile_error"] = str(e)
     
     # Check for Package.swift
-    package_swift = p.parent / "Package.swift"
-    result["has_swift_package"] = package_swift.exists()
+    result["has_swift_package"] = "Package.swift" in siblings
     
     # Check for Carthage
-    cartfile = p.parent / "Cartfile"
-    result["has_carthage"] = cartfile.exists()
+    result["has_carthage"] = "Cartfile" in siblings
     
     return result
 
 
+# xcodebuild -showBuildSettings takes seconds; cache parsed results keyed on
+# (project, scheme, configuration) and stamped with the mtimes of the files
+# whose changes can alter the settings.
+_BUILD_SETTINGS_CACHE: Dict[tuple, tuple] = {}
+
+_WORKSPACE_PROJECTS_CACHE: Dict[str, tuple] = {}
+
+def _workspace_projects(p: Path) -> List[Path]:
+    """.xcodeproj bundles referenced by a workspace (nested groups included), cached on its mtime."""
+    contents = p / "contents.xcworkspacedata"
+    stamp = _mtime_stamp(contents)
+    cached = _memo_get(_WORKSPACE_PROJECTS_CACHE, str(p), stamp)
+    if cached is not None:
+        return cached
+    
+    projects = []
+    
+    def walk(element: ElementTree.Element, base: str) -> None:
+        for child in element:
+            kind, _, path = child.get("location", "").partition(":")
+            if kind == "group":
+                location = os.path.join(base, path)
+            elif kind == "container":
+                location = os.path.join(str(p.parent), path)
+            elif kind == "absolute":
+                location = path
+            else:
+                continue  # self: (embedded) and developer: never hold member projects
+            if child.tag == "Group":
+                walk(child, location)
+            elif child.tag == "FileRef" and location.endswith(".xcodeproj"):
+                projects.append(Path(os.path.normpath(location)))
+    
+    try:
+        walk(ElementTree.parse(contents).getroot(), str(p.parent))
+    except (OSError, ElementTree.ParseError):
+        pass
+    _memo_put(_WORKSPACE_PROJECTS_CACHE, str(p), stamp, projects)
+    return projects
+
+def _build_settings_stamp(p: Path) -> tuple:
+    """
+    mtimes (ns) of the project file and Podfile.lock, 0 when missing. For a
+    workspace, the project.pbxproj of every member project is included too:
+    their settings are what xcodebuild reports.
+    """
+    if p.suffix == ".xcworkspace":
+        files = [p / "contents.xcworkspacedata"]
+        files.extend(project / "project.pbxproj" for project in _workspace_projects(p))
+    else:
+        files = [p / "project.pbxproj"]
+    return _mtime_stamp(*files, p.parent / "Podfile.lock")
+
+
+_BUILD_TARGET_HEADER_RE = re.compile(
+    r"^[ \t]*Build settings for action build and target (.*?):*[ \t]*$", re.MULTILINE
+)
+
+def _parse_build_settings(stdout: str) -> Dict[str, Dict[str, str]]:
+    """Parse `xcodebuild -showBuildSettings` output into {target: {key: value}}."""
+    # Splitting on the target headers yields [preamble, name1, body1, name2, body2, ...]
+    parts = _BUILD_TARGET_HEADER_RE.split(stdout)
+    settings = {}
+    for target, body in zip(parts[1::2], parts[2::2]):
+        target_settings = {}
+        for line in body.splitlines():
+            # partition never raises and allocates no list; the line is
+            # already stripped so only the inner edges need trimming
+            key, sep, value = line.strip().partition(" = ")
+            if sep:
+                target_settings[key.rstrip()] = value.lstrip()
+        settings[target.strip()] = target_settings
+    return settings
+
+
+# project.pbxproj is an old-style (OpenStep) plist, which plistlib cannot read.
+# Tokens: whitespace/comments (no group), quoted string (1), bare string (2), punctuation (3)
+_PBX_TOKEN_RE = re.compile(
+    r'\s+|/\*.*?\*/|//[^\n]*|"((?:[^"\\]|\\.)*)"|([\w$+/:.\-]+)|([{}()=;,])', re.S
+)
+_PBX_ESCAPE_RE = re.compile(r"\\(.)")
+_PBX_ESCAPES = {"n": "\n", "t": "\t"}
+
+def _parse_pbxproj(text: str) -> Any:
+    """Parse an OpenStep plist into dicts, lists and strings. Raises ValueError/IndexError if malformed."""
+    tokens = []
+    for m in _PBX_TOKEN_RE.finditer(text):
+        kind = m.lastindex
+        if kind == 1:
+            tokens.append((1, _PBX_ESCAPE_RE.sub(lambda e: _PBX_ESCAPES.get(e[1], e[1]), m[1])))
+        elif kind:
+            tokens.append((kind, m[kind]))
+    
+    def value(i: int):
+        kind, tok = tokens[i]
+        if kind != 3:
+            return tok, i + 1
+        if tok == "{":
+            d = {}
+            i += 1
+            while tokens[i] != (3, "}"):
+                key, i = value(i)
+                if tokens[i] != (3, "="):
+                    raise ValueError(f"expected '=' after {key!r}")
+                d[key], i = value(i + 1)
+                if tokens[i] != (3, ";"):
+                    raise ValueError(f"expected ';' after value of {key!r}")
+                i += 1
+            return d, i + 1
+        if tok == "(":
+            items = []
+            i += 1
+            while tokens[i] != (3, ")"):
+                item, i = value(i)
+                items.append(item)
+                if tokens[i] == (3, ","):
+                    i += 1
+                elif tokens[i] != (3, ")"):
+                    raise ValueError("expected ',' or ')' in array")
+            return items, i + 1
+        raise ValueError(f"unexpected {tok!r}")
+    
+    return value(0)[0]
+
+
+_SEARCH_PATH_SETTINGS = (
+    "FRAMEWORK_SEARCH_PATHS",
+    "LIBRARY_SEARCH_PATHS",
+    "HEADER_SEARCH_PATHS",
+    "SWIFT_INCLUDE_PATHS",
+)
+# Xcode writes file and build-file objects one per line; they are most of a
+# large pbxproj and irrelevant to settings, so drop them before tokenizing
+_PBX_FILE_OBJECT_RE = re.compile(
+    r"^\t\t\w+ (?:/\* .*? \*/ )?= \{isa = (?:PBXBuildFile|PBXFileReference); .*\n", re.M
+)
+_SEARCH_PATH_CONDITIONAL_PREFIXES = tuple(key + "[" for key in _SEARCH_PATH_SETTINGS)
+_PROJECT_DIR_VAR_RE = re.compile(r"\$[({](?:SRCROOT|PROJECT_DIR)[)}]")
+_PBX_SETTINGS_CACHE: Dict[tuple, tuple] = {}
+
+def _fast_build_settings(p: Path, configuration: str = "Debug") -> Optional[Dict[str, Any]]:
+    """
+    Search path settings read straight from project.pbxproj, in the shape
+    read_build_settings returns, or None when only xcodebuild can answer:
+    workspaces, configurations based on an .xcconfig (CocoaPods),
+    conditional variants (KEY[sdk=...], KEY[arch=...]), values using build
+    variables other than $(SRCROOT)/$(PROJECT_DIR), or a file that does not
+    parse. Saves the seconds xcodebuild spends loading the
+    target graph.
+    """
+    if p.suffix != ".xcodeproj":
+        return None
+    
+    pbxproj = p / "project.pbxproj"
+    cache_key = (str(p), configuration)
+    stamp = _mtime_stamp(pbxproj)
+    cached = _memo_get(_PBX_SETTINGS_CACHE, cache_key, stamp)
+    if cached is not None:
+        # {} records "not answerable without xcodebuild"
+        return cached or None
+    
+    try:
+        with open(pbxproj, encoding="utf-8") as f:
+            root = _parse_pbxproj(_PBX_FILE_OBJECT_RE.sub("", f.read()))
+        objects = root["objects"]
+        project = objects[root["rootObject"]]
+        
+        def config_settings(list_id: str) -> Optional[Dict[str, Any]]:
+            for config_id in objects[list_id].get("buildConfigurations", []):
+                config = objects[config_id]
+                if config.get("name") == configuration:
+                    if "baseConfigurationReference" in config:
+                        return None
+                    settings = config.get("buildSettings", {})
+                    # xcodebuild resolves conditionals per SDK/arch; don't guess
+                    if any(key.startswith(_SEARCH_PATH_CONDITIONAL_PREFIXES) for key in settings):
+                        return None
+                    return settings
+            return None
+        
+        # PROJECT_DIR (and SRCROOT, which defaults to it) is the .xcodeproj's
+        # directory joined with the project's projectDirPath
+        if project.get("projectRoot"):
+            raise ValueError("custom projectRoot needs xcodebuild to resolve SRCROOT")
+        project_dir = os.path.normpath(os.path.join(str(p.parent), project.get("projectDirPath") or ""))
+        
+        def expand(value: Any, inherited: str) -> Optional[str]:
+            items = value.split() if isinstance(value, str) else value
+            expanded = []
+            for item in items:
+                item = item.strip('"')
+                if item == "$(inherited)":
+                    if inherited:
+                        expanded.append(inherited)
+                    continue
+                item = _PROJECT_DIR_VAR_RE.sub(lambda _: project_dir, item)
+                if "$" in item:
+                    return None
+                expanded.append(item)
+            return " ".join(expanded)
+        
+        project_settings = config_settings(project["buildConfigurationList"])
+        if project_settings is None:
+            raise ValueError("project configuration not found, based on an .xcconfig or conditional")
+        
+        base = {}
+        for key in _SEARCH_PATH_SETTINGS:
+            if key in project_settings:
+                base[key] = expand(project_settings[key], "")
+                if base[key] is None:
+                    raise ValueError(f"{key} needs xcodebuild to expand")
+        
+        targets = {}
+        for target_id in project.get("targets", []):
+            target = objects[target_id]
+            target_settings = config_settings(target["buildConfigurationList"])
+            if target_settings is None:
+                raise ValueError(f"configuration of {target.get('name')} not resolvable")
+            merged = dict(base)
+            for key in _SEARCH_PATH_SETTINGS:
+                if key in target_settings:
+                    merged[key] = expand(target_settings[key], base.get(key, ""))
+                    if merged[key] is None:
+                        raise ValueError(f"{key} needs xcodebuild to expand")
+            targets[target["name"]] = merged
+        
+        result = {
+            "configuration": configuration,
+            "scheme": None,
+            "targets": targets
+        } if targets else {}
+    except (OSError, UnicodeDecodeError, ValueError, IndexError, KeyError, TypeError, AttributeError):
+        result = {}
+    
+    _memo_put(_PBX_SETTINGS_CACHE, cache_key, stamp, result)
+    return result or None
+
+
+@mcp.tool()
+def clear_build_settings_cache() -> Dict[str, Any]:
+    """
+    Discard cached build settings and CocoaPods status.
+    Call this after 'pod install' or other changes that modify build settings
+    without touching the project file.
+    """
+    caches = (_BUILD_SETTINGS_CACHE, _WORKSPACE_PROJECTS_CACHE, _PBX_SETTINGS_CACHE, _COCOAPODS_CACHE, _POD_VERSION_CACHE)
+    cleared = sum(len(cache) for cache in caches)
+    for cache in caches:
+        cache.clear()
+    return {"cleared_entries": cleared}
+
+
 @mcp.tool()
 def read_build_settings(
     project_path: str,
@@ -324,11 +958,17 @@ def read_build_settings(
     Returns:
         Build settings including paths, frameworks, linker flags
     """
-    p = Path(project_path).expanduser().resolve()
+    p = _resolve(project_path)
     
     if not p.exists():
         return {"error": f"Project not found: {project_path}"}
     
+    cache_key = (str(p), scheme, configuration)
+    stamp = _build_settings_stamp(p)
+    cached = _memo_get(_BUILD_SETTINGS_CACHE, cache_key, stamp)
+    if cached is not None:
+        return cached
+    
     # Build xcodebuild command
     cmd = ["xcodebuild", "-showBuildSettings"]
     
@@ -357,25 +997,15 @@ def read_build_settings(
                 "returncode": result.returncode
             }
         
-        # Parse build settings
-        settings = {}
-        current_target = None
-        
-        for line in result.stdout.split('\n'):
-            line = line.strip()
-            
-            if line.startswith("Build settings for action build and target"):
-                current_target = line.split("target")[-1].strip().rstrip(":")
-                settings[current_target] = {}
-            elif " = " in line and current_target:
-                key, value = line.split(" = ", 1)
-                settings[current_target][key.strip()] = value.strip()
+        settings = _parse_build_settings(result.stdout)
         
-        return {
+        build_settings = {
             "configuration": configuration,
             "scheme": scheme,
             "targets": settings
         }
+        _memo_put(_BUILD_SETTINGS_CACHE, cache_key, stamp, build_settings)
+        return build_settings
         
     except subprocess.TimeoutExpired:
         return {"error": "xcodebuild command timed out"}
@@ -388,6 +1018,8 @@ def check_framework_search_paths(project_path: str) -> Dict[str, Any]:
     """
     Specifically check framework and library search paths.
     This is the #1 cause of library loading issues.
+    Paths are read from project.pbxproj when it holds them directly, and from
+    xcodebuild otherwise (workspaces, CocoaPods .xcconfig files).
     
     Args:
         project_path: Path to .xcodeproj or .xcworkspace
@@ -395,7 +1027,10 @@ def check_framework_search_paths(project_path: str) -> Dict[str, Any]:
     Returns:
         Framework search paths and validation of their existence
     """
-    settings = read_build_settings(project_path)
+    # Only the settings are cached; existence is checked on every call so
+    # that creating a missing directory shows up immediately
+    p = _resolve(project_path)
+    settings = _fast_build_settings(p) or read_build_settings(project_path)
     
     if "error" in settings:
         return settings
@@ -428,7 +1063,7 @@ def check_framework_search_paths(project_path: str) -> Dict[str, Any]:
         
         result["search_paths_by_target"][target_name] = paths_info
         
-        # Validate paths exist
+        # Collect paths to validate; existence is checked for all targets at once
         validation = {}
         for path_type, paths in paths_info.items():
             validation[path_type] = {}
@@ -436,17 +1071,76 @@ def check_framework_search_paths(project_path: str) -> Dict[str, Any]:
                 # Clean up Xcode variables
                 clean_path = path.replace("$(inherited)", "").strip()
                 if clean_path and not clean_path.startswith("$"):
-                    expanded = Path(clean_path).expanduser()
                     validation[path_type][path] = {
-                        "exists": expanded.exists(),
-                        "expanded_path": str(expanded)
+                        "exists": False,
+                        "expanded_path": str(Path(clean_path).expanduser())
                     }
         
         result["validation"][target_name] = validation
     
+    # Targets mostly share their search paths
+    exists = _paths_exist(
+        status["expanded_path"]
+        for validation in result["validation"].values()
+        for statuses in validation.values()
+        for status in statuses.values()
+    )
+    for validation in result["validation"].values():
+        for statuses in validation.values():
+            for status in statuses.values():
+                status["exists"] = exists[status["expanded_path"]]
+    
     return result
 
 
+def _paths_exist(paths: Iterable[str]) -> Dict[str, bool]:
+    """
+    Existence of each path, answered once per distinct path. Parents holding
+    several candidates (Pods/*, build/Products/*) are listed with a single
+    os.scandir instead of one stat per sibling; lone paths get one stat.
+    The listing only confirms names: a name it lacks is still stat'ed, since
+    case-insensitive volumes (default APFS) and Unicode normalization let
+    a differently spelled path resolve, as it does for the compiler.
+    """
+    by_parent: Dict[str, Dict[str, str]] = {}
+    exists: Dict[str, bool] = {}
+    for path in paths:
+        parent, name = os.path.split(path)
+        if name in ("", ".", ".."):
+            exists[path] = os.path.exists(path)
+        else:
+            by_parent.setdefault(parent, {})[name] = path
+    
+    for parent, names in by_parent.items():
+        if len(names) == 1:
+            for path in names.values():
+                exists[path] = os.path.exists(path)
+            continue
+        try:
+            with os.scandir(parent or ".") as it:
+                entries = {entry.name: entry for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            # No parent directory, so none of its candidates can exist
+            for path in names.values():
+                exists[path] = False
+            continue
+        except OSError:
+            # e.g. search-only permission: listing fails, stat may not
+            for path in names.values():
+                exists[path] = os.path.exists(path)
+            continue
+        for name, path in names.items():
+            entry = entries.get(name)
+            # exists() follows symlinks, so dangling links still report False
+            if entry is None or entry.is_symlink():
+                exists[path] = os.path.exists(path)
+            else:
+                exists[path] = True
+    return exists
+
+# Linker flags that name a dependency; each must start a whitespace-separated token
+_LDFLAGS_RE = re.compile(r"(?<!\S)(?:-framework\s+(\S+)|-l(\S+))")
+
 @mcp.tool()
 def list_linked_frameworks(project_path: str) -> Dict[str, Any]:
     """
@@ -468,27 +1162,13 @@ def list_linked_frameworks(project_path: str) -> Dict[str, Any]:
     for target_name, target_settings in settings.get("targets", {}).items():
         frameworks = []
         
-        # Get linked frameworks from OTHER_LDFLAGS
-        if "OTHER_LDFLAGS" in target_settings:
-            flags = target_settings["OTHER_LDFLAGS"]
-            # Parse -framework flags
-            parts = flags.split()
-            i = 0
-            while i < len(parts):
-                if parts[i] == "-framework" and i + 1 < len(parts):
-                    frameworks.append({
-                        "name": parts[i + 1],
-                        "type": "framework"
-                    })
-                    i += 2
-                elif parts[i].startswith("-l"):
-                    frameworks.append({
-                        "name": parts[i][2:],
-                        "type": "library"
-                    })
-                    i += 1
-                else:
-                    i += 1
+        # Get linked frameworks from OTHER_LDFLAGS (-framework NAME / -lNAME)
+        for m in _LDFLAGS_RE.finditer(target_settings.get("OTHER_LDFLAGS", "")):
+            framework, library = m.groups()
+            if framework:
+                frameworks.append({"name": framework, "type": "framework"})
+            else:
+                frameworks.append({"name": library, "type": "library"})
         
         result[target_name] = frameworks
     
@@ -499,6 +1179,63 @@ def list_linked_frameworks(project_path: str) -> Dict[str, Any]:
 # BUILD LOGS & ERROR ANALYSIS
 # ============================================================================
 
+# .xcactivitylog files are gzipped SLF; compiler output is embedded as plain
+# text, so diagnostics can be pulled out without a full SLF parser.
+_LOG_DIAG_RE = re.compile(rb"\b(error|warning): ([^\r\n]{1,500})")
+_LOG_MAX_DIAGNOSTICS = 50           # per kind, per log
+_LOG_CHUNK_BYTES = 1 << 20
+_LOG_SCAN_LIMIT = 64 << 20          # decompressed bytes scanned per log
+
+def _scan_activity_log(log_file: Path) -> Dict[str, Any]:
+    """Stream-decompress an .xcactivitylog and collect unique error/warning lines."""
+    found = {b"error": {}, b"warning": {}}  # dicts as ordered sets
+    scanned = 0
+    tail = b""
+    
+    def collect(data: bytes) -> None:
+        for m in _LOG_DIAG_RE.finditer(data):
+            bucket = found[m.group(1)]
+            if len(bucket) >= _LOG_MAX_DIAGNOSTICS:
+                continue
+            # Include the 'file:line:col: ' prefix when present
+            lo = max(0, m.start() - 512)
+            start = max(data.rfind(b"\n", lo, m.start()), data.rfind(b"\r", lo, m.start()), data.rfind(b'"', lo, m.start())) + 1
+            bucket[data[max(start, lo):m.end()].strip()] = None
+    
+    try:
+        with gzip.open(log_file, 'rb') as gz:
+            while True:
+                chunk = gz.read(_LOG_CHUNK_BYTES) if scanned < _LOG_SCAN_LIMIT else b""
+                scanned += len(chunk)
+                data = tail + chunk
+                if chunk:
+                    # Scan complete lines only and carry the unfinished one
+                    # into the next chunk, so a diagnostic crossing the
+                    # boundary is seen once and whole. A line longer than a
+                    # chunk is cut anyway to bound the carry.
+                    cut = max(data.rfind(b"\n"), data.rfind(b"\r")) + 1
+                    if len(data) - cut > _LOG_CHUNK_BYTES:
+                        cut = len(data) - 1024
+                    data, tail = data[:cut], data[cut:]
+                collect(data)
+                if not chunk or all(len(b) >= _LOG_MAX_DIAGNOSTICS for b in found.values()):
+                    break
+    except (OSError, EOFError, zlib.error) as e:
+        # Keep whatever was found before a truncated/corrupt stream
+        parse_error = str(e)
+    else:
+        parse_error = None
+    
+    scan = {
+        "errors": [line.decode(errors="replace") for line in found[b"error"]],
+        "warnings": [line.decode(errors="replace") for line in found[b"warning"]],
+        "scanned_bytes": scanned
+    }
+    if parse_error:
+        scan["parse_error"] = parse_error
+    return scan
+
+
 @mcp.tool()
 def get_recent_build_logs(
     project_path: str,
@@ -514,7 +1251,7 @@ def get_recent_build_logs(
     Returns:
         Recent build logs with errors and warnings extracted
     """
-    p = Path(project_path).expanduser().resolve()
+    p = _resolve(project_path)
     project_name = p.stem
     
     # Find DerivedData
@@ -523,18 +1260,18 @@ def get_recent_build_logs(
     if not derived_data.exists():
         return {"error": "DerivedData directory not found"}
     
-    # Look for project-specific derived data
-    project_dirs = []
-    for item in derived_data.iterdir():
-        if item.is_dir() and item.name.startswith(project_name):
-            project_dirs.append(item)
+    # Look for project-specific derived data; DirEntry caches its stat()
+    with os.scandir(derived_data) as it:
+        project_dirs = [
+            e for e in it
+            if e.is_dir(follow_symlinks=False) and e.name.startswith(project_name)
+        ]
     
     if not project_dirs:
         return {"error": f"No DerivedData found for project: {project_name}"}
     
-    # Get most recent project dir
-    project_dirs.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-    latest_derived = project_dirs[0]
+    # Get most recent project dir (O(N) selection, no sort)
+    latest_derived = Path(max(project_dirs, key=lambda e: e.stat().st_mtime).path)
     
     # Look for build logs
     logs_dir = latest_derived / "Logs" / "Build"
@@ -542,11 +1279,10 @@ def get_recent_build_logs(
     if not logs_dir.exists():
         return {"error": "Build logs directory not found"}
     
-    log_files = sorted(
-        logs_dir.glob("*.xcactivitylog"),
-        key=lambda x: x.stat().st_mtime,
-        reverse=True
-    )[:max_logs]
+    with os.scandir(logs_dir) as it:
+        log_entries = [e for e in it if e.name.endswith(".xcactivitylog")]
+    latest_logs = heapq.nlargest(max_logs, log_entries, key=lambda e: e.stat().st_mtime)
+    log_files = [Path(e.path) for e in latest_logs]
     
     result = {
         "derived_data_path": str(latest_derived),
@@ -554,17 +1290,18 @@ def get_recent_build_logs(
         "logs": []
     }
     
-    for log_file in log_files:
+    # Decompression releases the GIL, so logs are scanned concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(len(log_files), os.cpu_count() or 1))) as pool:
+        scans = list(pool.map(_scan_activity_log, log_files))
+    
+    for entry, scan in zip(latest_logs, scans):
+        st = entry.stat()
         log_info = {
-            "path": str(log_file),
-            "timestamp": datetime.fromtimestamp(log_file.stat().st_mtime).isoformat(),
-            "size": log_file.stat().st_size
+            "path": entry.path,
+            "timestamp": datetime.fromtimestamp(st.st_mtime).isoformat(),
+            "size": st.st_size
         }
-        
-        # Note: .xcactivitylog files are gzipped and binary
-        # For actual parsing, you'd need to decompress and parse
-        # For now, just provide metadata
-        log_info["note"] = "Binary log file - use Xcode or xcodebuild to view"
+        log_info.update(scan)
         
         result["logs"].append(log_info)
     
@@ -587,7 +1324,7 @@ def run_clean_build(
     Returns:
         Build output with errors/warnings extracted
     """
-    p = Path(project_path).expanduser().resolve()
+    p = _resolve(project_path)
     
     if not p.exists():
         return {"error": f"Project not found: {project_path}"}
@@ -604,10 +1341,11 @@ def run_clean_build(
         clean_cmd.extend(["-scheme", scheme])
     
     try:
-        clean_result = subprocess.run(
+        # Clean output is never inspected, so don't buffer it
+        subprocess.run(
             clean_cmd,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=60
         )
         
@@ -615,30 +1353,73 @@ def run_clean_build(
         build_cmd = list(clean_cmd)
         build_cmd[1] = "build"  # Replace 'clean' with 'build'
         
-        build_result = subprocess.run(
+        # Binary pipes: lines are scanned as bytes and only the kept
+        # diagnostics and tails are decoded. A session of its own lets the
+        # watchdog kill compiler/build-service grandchildren holding the pipes.
+        build_proc = subprocess.Popen(
             build_cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=-1,
+            start_new_session=True
         )
         
-        # Extract errors and warnings
+        # Extract errors and warnings while streaming; only the tail of
+        # each stream is retained for the response
         errors = []
         warnings = []
+        stdout_tail = deque(maxlen=_BUILD_TAIL_LINES)
+        stderr_tail = deque(maxlen=_BUILD_TAIL_LINES)
+        
+        def drain_stderr():
+            for line in build_proc.stderr:
+                stderr_tail.append(line)
+                m = _BUILD_DIAG_RE.search(line)
+                if m is None:
+                    continue
+                # 'error:' wins when a line mentions both
+                if m.group(1).lower() == b"error" or _BUILD_ERROR_RE.search(line, m.end()):
+                    errors.append(line.strip().decode(errors="replace"))
+                else:
+                    warnings.append(line.strip().decode(errors="replace"))
+        
+        readers = (
+            threading.Thread(target=stdout_tail.extend, args=(build_proc.stdout,), daemon=True),
+            threading.Thread(target=drain_stderr, daemon=True),
+        )
+        for reader in readers:
+            reader.start()
+        
+        timer = _watchdog(build_proc, _BUILD_TIMEOUT, group=True)
+        try:
+            # The readers end at EOF, once every process holding the pipes
+            # has exited. Stop waiting on them when the watchdog fires: a
+            # process that escaped the group could hold the pipes forever.
+            for reader in readers:
+                while reader.is_alive() and not timer.fired:
+                    reader.join(0.2)
+            if timer.fired:
+                timer.join()
+                for reader in readers:
+                    reader.join(1)
+            returncode = build_proc.wait()
+        finally:
+            timer.cancel()
+            _terminate(build_proc, group=True)
         
-        for line in build_result.stderr.split('\n'):
-            if 'error:' in line.lower():
-                errors.append(line.strip())
-            elif 'warning:' in line.lower():
-                warnings.append(line.strip())
+        if timer.fired:
+            return {"error": "Build timed out"}
+        
+        stdout = b"".join(stdout_tail).decode(errors="replace")
+        stderr = b"".join(stderr_tail).decode(errors="replace")
         
         return {
-            "success": build_result.returncode == 0,
-            "returncode": build_result.returncode,
+            "success": returncode == 0,
+            "returncode": returncode,
             "errors": errors,
             "warnings": warnings,
-            "stdout": build_result.stdout[-2000:] if build_result.stdout else "",  # Last 2000 chars
-            "stderr": build_result.stderr[-2000:] if build_result.stderr else ""
+            "stdout": stdout[-2000:],  # Last 2000 chars
+            "stderr": stderr[-2000:]
         }
         
     except subprocess.TimeoutExpired:
@@ -651,23 +1432,62 @@ def run_clean_build(
 # DEPENDENCIES & PACKAGE MANAGEMENT
 # ============================================================================
 
+_COCOAPODS_CACHE: Dict[tuple, tuple] = {}
+_POD_VERSION_CACHE: Dict[str, tuple] = {}
+
+def _pod_command_status() -> Dict[str, Any]:
+    """
+    `pod --version` result fields, re-probed only when the pod executable
+    found on PATH changes (installed, upgraded or removed): the probe pays
+    a full Ruby startup.
+    """
+    pod = shutil.which("pod")
+    stamp = (pod,) + (_mtime_stamp(Path(pod)) if pod else ())
+    cached = _memo_get(_POD_VERSION_CACHE, "pod", stamp)
+    if cached is not None:
+        return cached
+    
+    try:
+        pod_version = subprocess.run(
+            ["pod", "--version"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        status = {"pod_version": pod_version.stdout.strip()}
+    except Exception:
+        status = {"pod_command_available": False}
+    
+    _memo_put(_POD_VERSION_CACHE, "pod", stamp, status)
+    return status
+
 @mcp.tool()
-def check_cocoapods_status(project_path: str) -> Dict[str, Any]:
+def check_cocoapods_status(project_path: str, detail: FileDetail = "meta") -> Dict[str, Any]:
     """
     Check CocoaPods installation and pod status.
     
     Args:
         project_path: Path to project directory (not .xcodeproj)
+        detail: How much of Podfile/Podfile.lock/Manifest.lock to return:
+            "meta" (size + mtime, default), "digest" (adds SHA-1) or "content" (adds text)
     
     Returns:
         CocoaPods status, installed pods, and potential issues
     """
-    p = Path(project_path).expanduser().resolve()
+    p = _resolve(project_path)
     
     # If given .xcodeproj, go up to parent
     if p.suffix == ".xcodeproj":
         p = p.parent
     
+    # Skips the directory and file reads until the project directory,
+    # Podfiles or Pods/ change. The pod command probe is not project state
+    # and is cached separately.
+    stamp = _mtime_stamp(p, p / "Podfile", p / "Podfile.lock", p / "Pods", p / "Pods" / "Manifest.lock")
+    cached = _memo_get(_COCOAPODS_CACHE, (str(p), detail), stamp)
+    if cached is not None:
+        return {**cached, **_pod_command_status()}
+    
     result = {
         "project_dir": str(p),
         "has_podfile": False,
@@ -675,75 +1495,78 @@ def check_cocoapods_status(project_path: str) -> Dict[str, Any]:
         "pods_installed": False
     }
     
+    # One directory read answers the Podfile / Podfile.lock / Pods checks
+    try:
+        with os.scandir(p) as it:
+            entries = {e.name: e for e in it}
+    except OSError:
+        entries = {}
+    
     # Check for Podfile
     podfile = p / "Podfile"
-    result["has_podfile"] = podfile.exists()
+    result["has_podfile"] = "Podfile" in entries
     
     if result["has_podfile"]:
         try:
-            with open(podfile, 'r') as f:
-                result["podfile_content"] = f.read()
+            result["podfile"] = _file_info(podfile, detail)
         except Exception as e:
             result["podfile_error"] = str(e)
     
     # Check for Podfile.lock
     podfile_lock = p / "Podfile.lock"
-    result["has_podfile_lock"] = podfile_lock.exists()
+    result["has_podfile_lock"] = "Podfile.lock" in entries
     
     if result["has_podfile_lock"]:
         try:
-            with open(podfile_lock, 'r') as f:
-                result["podfile_lock_content"] = f.read()
+            result["podfile_lock"] = _file_info(podfile_lock, detail)
         except Exception as e:
             result["podfile_lock_error"] = str(e)
     
     # Check Pods directory
     pods_dir = p / "Pods"
-    result["pods_installed"] = pods_dir.exists()
+    result["pods_installed"] = "Pods" in entries
     
     if result["pods_installed"]:
-        # List installed pods
-        installed_pods = []
-        pods_manifest = pods_dir / "Manifest.lock"
-        if pods_manifest.exists():
+        # A second directory read lists the pods and finds Manifest.lock;
+        # DirEntry.is_dir() answers from d_type without a stat per pod
+        try:
+            with os.scandir(pods_dir) as it:
+                pod_entries = list(it)
+        except OSError:
+            pod_entries = []
+        
+        if any(e.name == "Manifest.lock" for e in pod_entries):
             try:
-                with open(pods_manifest, 'r') as f:
-                    result["manifest_lock"] = f.read()
+                result["manifest_lock"] = _file_info(pods_dir / "Manifest.lock", detail)
             except Exception as e:
                 result["manifest_error"] = str(e)
         
         # Count pod directories
-        pod_subdirs = [d for d in pods_dir.iterdir() if d.is_dir() and not d.name.startswith('.')]
-        result["installed_pod_count"] = len(pod_subdirs)
-        result["installed_pods"] = [d.name for d in pod_subdirs]
+        installed_pods = [e.name for e in pod_entries if not e.name.startswith('.') and e.is_dir()]
+        result["installed_pod_count"] = len(installed_pods)
+        result["installed_pods"] = installed_pods
     
-    # Check if pod command is available
-    try:
-        pod_version = subprocess.run(
-            ["pod", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        result["pod_version"] = pod_version.stdout.strip()
-    except Exception:
-        result["pod_command_available"] = False
+    _memo_put(_COCOAPODS_CACHE, (str(p), detail), stamp, result)
     
-    return result
+    # Check if pod command is available
+    return {**result, **_pod_command_status()}
 
 
 @mcp.tool()
-def check_swift_packages(project_path: str) -> Dict[str, Any]:
+def check_swift_packages(project_path: str, detail: FileDetail = "meta") -> Dict[str, Any]:
     """
     Check Swift Package Manager dependencies.
     
     Args:
         project_path: Path to .xcodeproj or .xcworkspace
+        detail: How much of Package.swift/Package.resolved to return:
+            "meta" (size + mtime, default), "digest" (adds SHA-1) or "content"
+            (adds Package.swift text and the parsed Package.resolved pins)
     
     Returns:
         Swift package dependencies and their status
     """
-    p = Path(project_path).expanduser().resolve()
+    p = _resolve(project_path)
     
     # If given .xcodeproj, go up to parent
     if p.suffix == ".xcodeproj":
@@ -761,8 +1584,7 @@ def check_swift_packages(project_path: str) -> Dict[str, Any]:
     
     if result["has_package_swift"]:
         try:
-            with open(package_swift, 'r') as f:
-                result["package_swift_content"] = f.read()
+            result["package_swift"] = _file_info(package_swift, detail)
         except Exception as e:
             result["package_swift_error"] = str(e)
     
@@ -770,9 +1592,13 @@ def check_swift_packages(project_path: str) -> Dict[str, Any]:
     package_resolved = p / "Package.resolved"
     if package_resolved.exists():
         try:
-            with open(package_resolved, 'r') as f:
-                resolved_content = json.load(f)
-                result["resolved_packages"] = resolved_content
+            if detail == "content":
+                # Parsed pins are more useful than the raw JSON text
+                result["package_resolved"] = _file_info(package_resolved, "meta")
+                with open(package_resolved, 'rb') as f:
+                    result["resolved_packages"] = _json_loads(f.read())
+            else:
+                result["package_resolved"] = _file_info(package_resolved, detail)
         except Exception as e:
             result["package_resolved_error"] = str(e)
     
@@ -787,19 +1613,108 @@ def check_swift_packages(project_path: str) -> Dict[str, Any]:
 # INFO.PLIST & CONFIGURATION FILES
 # ============================================================================
 
+# Build artifacts and vendored dependencies hold an Info.plist per embedded
+# framework; prune them before descending rather than filtering afterwards.
+_PLIST_EXCLUDE_DIRS = frozenset({"Pods", "DerivedData", ".build", ".git", "Carthage", "node_modules", ".swiftpm", "build"})
+
+# Keys returned by read_info_plist unless the caller asks for the full plist
+_INFO_PLIST_KEYS = (
+    "CFBundleIdentifier",
+    "CFBundleShortVersionString",
+    "CFBundleVersion",
+    "CFBundleDisplayName",
+    "CFBundlePackageType",
+    "NSAppTransportSecurity",
+    "UIBackgroundModes",
+)
+
+# Project ignore rules (.gitignore plus tool-specific .okangaignore) applied
+# on top of the hard exclusions, cached per root until either file changes.
+_IGNORE_FILES = (".gitignore", ".okangaignore")
+_IGNORE_CACHE: Dict[str, tuple] = {}
+
+def _plain_name_globs(lines: List[str]) -> List[str]:
+    """Ignore patterns that are bare name globs (match a file or directory name at any depth)."""
+    globs = []
+    for line in lines:
+        pattern = line.strip().rstrip("/")
+        if pattern and not pattern.startswith(("#", "!")) and "/" not in pattern:
+            globs.append(pattern)
+    return globs
+
+def _compile_ignore(lines: List[str]) -> Callable[[str], bool]:
+    """Build a matcher for root-relative POSIX paths (directories end with '/')."""
+    if pathspec is not None:
+        return pathspec.GitIgnoreSpec.from_lines(lines).match_file
+    
+    # Without pathspec, honor only plain name globs (no anchors or negation)
+    globs = _plain_name_globs(lines)
+    return lambda rel: any(fnmatch.fnmatch(rel.rstrip("/").rsplit("/", 1)[-1], g) for g in globs)
+
+def _ignore_matcher(root: Path) -> Optional[Callable[[str], bool]]:
+    """Matcher for root's ignore files, or None when it has none."""
+    stamp = []
+    for name in _IGNORE_FILES:
+        try:
+            stamp.append((root / name).stat().st_mtime_ns)
+        except OSError:
+            stamp.append(0)
+    stamp = tuple(stamp)
+    
+    cached = _IGNORE_CACHE.get(str(root))
+    if cached and cached[0] == stamp:
+        return cached[1]
+    
+    lines = []
+    for name, mtime in zip(_IGNORE_FILES, stamp):
+        if mtime:
+            try:
+                lines.extend((root / name).read_text(errors="replace").splitlines())
+            except OSError:
+                pass
+    matcher = _compile_ignore(lines) if lines else None
+    _IGNORE_CACHE[str(root)] = (stamp, matcher)
+    return matcher
+
+def _iter_info_plists(root: Path) -> Iterator[tuple]:
+    """Yield (path, root-relative path) of Info.plist files under root, skipping excluded and ignored directories."""
+    ignored = _ignore_matcher(root)
+    stack = [(str(root), "")]
+    while stack:
+        d, rel_dir = stack.pop()
+        try:
+            entries = os.scandir(d)
+        except OSError:
+            continue
+        with entries:
+            for e in entries:
+                rel = rel_dir + e.name
+                if e.is_dir(follow_symlinks=False):
+                    if e.name in _PLIST_EXCLUDE_DIRS or (ignored and ignored(rel + "/")):
+                        continue
+                    stack.append((e.path, rel + "/"))
+                elif e.name == "Info.plist" and not (ignored and ignored(rel)):
+                    yield e.path, rel
+
+
 @mcp.tool()
-def read_info_plist(project_path: str, target: Optional[str] = None) -> Dict[str, Any]:
+def read_info_plist(
+    project_path: str,
+    target: Optional[str] = None,
+    full: bool = False
+) -> Dict[str, Any]:
     """
     Read and validate Info.plist file.
     
     Args:
         project_path: Path to .xcodeproj
         target: Specific target (optional, will find automatically)
+        full: Return every key instead of only the commonly needed ones (default False)
     
     Returns:
         Info.plist contents and validation
     """
-    p = Path(project_path).expanduser().resolve()
+    p = _resolve(project_path)
     
     # If given .xcodeproj, go up to parent to find source files
     if p.suffix == ".xcodeproj":
@@ -811,25 +1726,29 @@ def read_info_plist(project_path: str, target: Optional[str] = None) -> Dict[str
     }
     
     # Search for Info.plist files
-    plist_files = list(p.rglob("Info.plist"))
-    
-    for plist_file in plist_files:
+    # plistlib handles XML and binary plists in-process; the walk already
+    # knows each file exists and its relative path
+    for plist_path, rel_path in _iter_info_plists(p):
         plist_info = {
-            "path": str(plist_file),
-            "relative_path": str(plist_file.relative_to(p))
+            "path": plist_path,
+            "relative_path": rel_path
         }
         
         try:
-            with open(plist_file, 'rb') as f:
+            with open(plist_path, 'rb') as f:
                 plist_data = plistlib.load(f)
+            
+            if full:
                 plist_info["contents"] = plist_data
-                
-                # Extract key info
-                plist_info["bundle_id"] = plist_data.get("CFBundleIdentifier", "Not set")
-                plist_info["version"] = plist_data.get("CFBundleShortVersionString", "Not set")
-                plist_info["build"] = plist_data.get("CFBundleVersion", "Not set")
-                plist_info["display_name"] = plist_data.get("CFBundleDisplayName", "Not set")
-                
+            else:
+                plist_info["contents"] = {k: plist_data[k] for k in _INFO_PLIST_KEYS if k in plist_data}
+            
+            # Extract key info
+            plist_info["bundle_id"] = plist_data.get("CFBundleIdentifier", "Not set")
+            plist_info["version"] = plist_data.get("CFBundleShortVersionString", "Not set")
+            plist_info["build"] = plist_data.get("CFBundleVersion", "Not set")
+            plist_info["display_name"] = plist_data.get("CFBundleDisplayName", "Not set")
+            
         except Exception as e:
             plist_info["error"] = str(e)
         
@@ -842,6 +1761,53 @@ def read_info_plist(project_path: str, target: Optional[str] = None) -> Dict[str
 # SIMULATOR MANAGEMENT
 # ============================================================================
 
+class _Simulator(NamedTuple):
+    name: Optional[str]
+    udid: Optional[str]
+    state: Optional[str]
+    runtime: str
+    available: bool
+
+
+# list_simulators and get_active_simulators are usually called back to back;
+# share one simctl invocation between them for a short window. Only the
+# fields the tools report are kept, not the full JSON document.
+_SIMCTL_CACHE_TTL = 2.0
+_SIMCTL_CACHE: Optional[tuple] = None  # (monotonic timestamp, List[_Simulator])
+
+def _simctl_devices() -> List[_Simulator]:
+    """Devices from `xcrun simctl list devices --json`, cached for _SIMCTL_CACHE_TTL seconds."""
+    global _SIMCTL_CACHE
+    now = time.monotonic()
+    if _SIMCTL_CACHE and now - _SIMCTL_CACHE[0] < _SIMCTL_CACHE_TTL:
+        return _SIMCTL_CACHE[1]
+    
+    # Keep stdout as bytes; the JSON parser decodes it directly
+    result = subprocess.run(
+        ["xcrun", "simctl", "list", "devices", "--json"],
+        capture_output=True,
+        timeout=10
+    )
+    
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.decode(errors="replace"))
+    
+    devices_data = _json_loads(result.stdout)
+    simulators = [
+        _Simulator(
+            device.get("name"),
+            device.get("udid"),
+            device.get("state"),
+            runtime,
+            device.get("isAvailable", False)
+        )
+        for runtime, devices in devices_data.get("devices", {}).items()
+        for device in devices
+    ]
+    _SIMCTL_CACHE = (now, simulators)
+    return simulators
+
+
 @mcp.tool()
 def list_simulators() -> Dict[str, Any]:
     """
@@ -851,29 +1817,7 @@ def list_simulators() -> Dict[str, Any]:
         List of simulators with status
     """
     try:
-        result = subprocess.run(
-            ["xcrun", "simctl", "list", "devices", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        if result.returncode != 0:
-            return {"error": result.stderr}
-        
-        devices_data = json.loads(result.stdout)
-        
-        # Simplify the output
-        simulators = []
-        for runtime, devices in devices_data.get("devices", {}).items():
-            for device in devices:
-                simulators.append({
-                    "name": device.get("name"),
-                    "udid": device.get("udid"),
-                    "state": device.get("state"),
-                    "runtime": runtime,
-                    "available": device.get("isAvailable", False)
-                })
+        simulators = [sim._asdict() for sim in _simctl_devices()]
         
         return {
             "simulators": simulators,
@@ -893,27 +1837,11 @@ def get_active_simulators() -> Dict[str, Any]:
         List of active simulators
     """
     try:
-        result = subprocess.run(
-            ["xcrun", "simctl", "list", "devices", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        if result.returncode != 0:
-            return {"error": result.stderr}
-        
-        devices_data = json.loads(result.stdout)
-        
-        active = []
-        for runtime, devices in devices_data.get("devices", {}).items():
-            for device in devices:
-                if device.get("state") == "Booted":
-                    active.append({
-                        "name": device.get("name"),
-                        "udid": device.get("udid"),
-                        "runtime": runtime
-                    })
+        active = [
+            {"name": sim.name, "udid": sim.udid, "runtime": sim.runtime}
+            for sim in _simctl_devices()
+            if sim.state == "Booted"
+        ]
         
         return {
             "active_simulators": active,
@@ -928,78 +1856,126 @@ def get_active_simulators() -> Dict[str, Any]:
 # DIAGNOSTIC SUMMARY
 # ============================================================================
 
+def _build_missing_report(validation_by_target: Dict[str, Any]) -> tuple:
+    """
+    Issues and suggestions for the search paths that do not exist.
+    
+    Args:
+        validation_by_target: check_framework_search_paths' "validation" mapping
+    
+    Returns:
+        (issues, suggestions) lists of messages
+    """
+    # Single pass over the validation: comprehensions run the filter on
+    # LIST_APPEND rather than generator resumes or .append calls, which
+    # matters at the thousands of entries large Pods setups produce
+    missing = [
+        (target, path_type, path, status.get("expanded_path"))
+        for target, validation in validation_by_target.items()
+        for path_type, paths in validation.items()
+        for path, status in paths.items()
+        if not status.get("exists")
+    ]
+    issues = [f"Missing {path_type} for {target}: {path}" for target, path_type, path, _ in missing]
+    # Issues are unique per (target, path_type, path), but targets share
+    # search paths: suggest each missing directory once, in first-seen order
+    suggestions = [
+        f"Verify path exists or remove from build settings: {expanded}"
+        for expanded in dict.fromkeys(expanded for _, _, _, expanded in missing)
+    ]
+    return issues, suggestions
+
+
 @mcp.tool()
-def diagnose_project(project_path: str) -> Dict[str, Any]:
+async def diagnose_project(project_path: str, quick: bool = False) -> Dict[str, Any]:
     """
     Comprehensive diagnostic of Xcode project.
     Runs multiple checks to identify common issues.
     
     Args:
         project_path: Path to .xcodeproj or .xcworkspace
+        quick: Skip the build settings, search path and Info.plist checks
+            (xcodebuild, project walk) and only check the project and CocoaPods
     
     Returns:
         Diagnostic report with identified issues and suggestions
     """
-    p = Path(project_path).expanduser().resolve()
+    # Check 1: Project exists and is valid. A mistyped path is the common
+    # failure, so answer it with one stat and no symlink resolution.
+    raw = os.path.abspath(os.path.expanduser(project_path))
+    if not os.path.exists(raw):
+        return {
+            "project_path": raw,
+            "timestamp": datetime.now().isoformat(),
+            "checks": {"project_exists": False},
+            "issues": [f"Project not found at: {raw}"],
+            "suggestions": []
+        }
     
+    # _resolve is memoized on the caller's string, so the helpers are handed
+    # project_path unchanged: their own _resolve calls are then cache hits
+    # (a resolved or parent string would be a new key and a full resolve)
+    p = _resolve(project_path)
     result = {
         "project_path": str(p),
         "timestamp": datetime.now().isoformat(),
-        "checks": {},
+        "checks": {"project_exists": True},
         "issues": [],
         "suggestions": []
     }
     
-    # Check 1: Project exists and is valid
-    result["checks"]["project_exists"] = p.exists()
-    if not p.exists():
-        result["issues"].append(f"Project not found at: {p}")
-        return result
-    
-    # Check 2: Dependencies
-    if p.suffix == ".xcodeproj":
-        parent = p.parent
+    # Check 2: Dependencies (check_cocoapods_status steps out of a .xcodeproj itself)
+    # The checks are independent and I/O bound (stat/open/xcodebuild), so
+    # run them concurrently on the default executor; as an async tool this
+    # also leaves the server's event loop free for other requests meanwhile.
+    # Framework paths reuse the build settings, so that pair is chained in
+    # one worker: the second call is a cache hit instead of a second
+    # xcodebuild run. xcodebuild only runs at all when project.pbxproj
+    # cannot answer on its own.
+    def settings_then_paths():
+        build_settings = _fast_build_settings(p) or read_build_settings(project_path)
+        return build_settings, check_framework_search_paths(project_path)
+    
+    if quick:
+        pods_status = await asyncio.to_thread(check_cocoapods_status, project_path)
     else:
-        parent = p
-    
-    pods_status = check_cocoapods_status(str(parent))
+        pods_status, (build_settings, framework_paths), plist_check = await asyncio.gather(
+            asyncio.to_thread(check_cocoapods_status, project_path),
+            asyncio.to_thread(settings_then_paths),
+            asyncio.to_thread(read_info_plist, project_path),
+        )
     result["checks"]["cocoapods"] = pods_status
     
     if pods_status.get("has_podfile") and not pods_status.get("pods_installed"):
         result["issues"].append("Podfile exists but pods not installed")
         result["suggestions"].append("Run: pod install")
     
-    # Check 3: Build settings
-    build_settings = read_build_settings(str(p))
-    result["checks"]["build_settings"] = "error" not in build_settings
-    
-    if "error" in build_settings:
-        result["issues"].append(f"Cannot read build settings: {build_settings.get('error')}")
-    
-    # Check 4: Framework search paths
-    framework_paths = check_framework_search_paths(str(p))
-    result["checks"]["framework_paths"] = framework_paths
-    
-    if "error" not in framework_paths:
-        # Check for missing paths
-        for target, validation in framework_paths.get("validation", {}).items():
-            for path_type, paths in validation.items():
-                for path, status in paths.items():
-                    if not status.get("exists"):
-                        result["issues"].append(
-                            f"Missing {path_type} for {target}: {path}"
-                        )
-                        result["suggestions"].append(
-                            f"Verify path exists or remove from build settings: {status.get('expanded_path')}"
-                        )
-    
-    # Check 5: Info.plist
-    plist_check = read_info_plist(str(p))
-    result["checks"]["info_plist"] = plist_check
-    
-    if not plist_check.get("info_plists"):
-        result["issues"].append("No Info.plist file found")
-        result["suggestions"].append("Create Info.plist file for your target")
+    if quick:
+        result["checks"]["quick"] = True
+    else:
+        # Check 3: Build settings
+        result["checks"]["build_settings"] = "error" not in build_settings
+        
+        if "error" in build_settings:
+            result["issues"].append(f"Cannot read build settings: {build_settings.get('error')}")
+        
+        # Check 4: Framework search paths
+        result["checks"]["framework_paths"] = framework_paths
+        
+        # Error results carry no validation; projects without search paths
+        # have an empty one. Either way there is nothing to report.
+        validation_by_target = framework_paths.get("validation")
+        if validation_by_target:
+            issues, suggestions = _build_missing_report(validation_by_target)
+            result["issues"] += issues
+            result["suggestions"] += suggestions
+        
+        # Check 5: Info.plist
+        result["checks"]["info_plist"] = plist_check
+        
+        if not plist_check.get("info_plists"):
+            result["issues"].append("No Info.plist file found")
+            result["suggestions"].append("Create Info.plist file for your target")
     
     # Summary
     result["summary"] = {